@@ -0,0 +1,112 @@
+# Generated by tools/generate_validator.py from release-schema.json; do not edit by hand.
+# pylint: skip-file
+SCHEMA_DIGEST = '89d89e72df1f3b39ddb48e5e3e857e044dda2078a6bf7fec32039c76272af301'
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/schema#', 'definitions': {'authorized_qrm_signers': {'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}}, 'type': 'object', 'properties': {'qrm': {'type': 'object', 'properties': {'documentation_home': {'type': 'string', 'description': 'Location of QRM documentation (e.g. URL of Pull Request, Network path of docx file)', 'minLength': 12}, 'primary_signer': {'description': 'Primary signer for this product component release; likely one of the primary authors as well.', 'oneOf': [{'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, {'type': 'string', 'enum': ['Cloud First Release - Find Primary Signer in QRM documentation home']}]}, 'peer_reviewer': {'description': 'Peer Reviewer for this product component release.', 'oneOf': [{'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, {'type': 'string', 'enum': ['Risk Level 2C - Peer Review not required', 'Cloud First Release - Find Peer Reviewer in QRM documentation home']}]}}, 'additionalProperties': False, 'required': ['documentation_home', 'primary_signer', 'peer_reviewer']}, 'url_git_repo': {'type': 'string', 'description': 'URL of the git repository for this product component. (Without `.git` ending)', 'minLength': 12}, 'path_qvws_git': {'type': 'string', 'description': 'Network path of compiled QVWs to use for development runs directly from git.', 'minLength': 12}, 'explicit_python_subfolder': {'type': 'boolean', 'description': 'Does this solution have an explicit python subfolder for its python library'}}, 'additionalProperties': False, 'required': ['qrm', 'url_git_repo']}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['qrm', 'url_git_repo']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/schema#', 'definitions': {'authorized_qrm_signers': {'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}}, 'type': 'object', 'properties': {'qrm': {'type': 'object', 'properties': {'documentation_home': {'type': 'string', 'description': 'Location of QRM documentation (e.g. URL of Pull Request, Network path of docx file)', 'minLength': 12}, 'primary_signer': {'description': 'Primary signer for this product component release; likely one of the primary authors as well.', 'oneOf': [{'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, {'type': 'string', 'enum': ['Cloud First Release - Find Primary Signer in QRM documentation home']}]}, 'peer_reviewer': {'description': 'Peer Reviewer for this product component release.', 'oneOf': [{'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, {'type': 'string', 'enum': ['Risk Level 2C - Peer Review not required', 'Cloud First Release - Find Peer Reviewer in QRM documentation home']}]}}, 'additionalProperties': False, 'required': ['documentation_home', 'primary_signer', 'peer_reviewer']}, 'url_git_repo': {'type': 'string', 'description': 'URL of the git repository for this product component. (Without `.git` ending)', 'minLength': 12}, 'path_qvws_git': {'type': 'string', 'description': 'Network path of compiled QVWs to use for development runs directly from git.', 'minLength': 12}, 'explicit_python_subfolder': {'type': 'boolean', 'description': 'Does this solution have an explicit python subfolder for its python library'}}, 'additionalProperties': False, 'required': ['qrm', 'url_git_repo']}, rule='required')
+        data_keys = set(data.keys())
+        if "qrm" in data_keys:
+            data_keys.remove("qrm")
+            data__qrm = data["qrm"]
+            if not isinstance(data__qrm, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".qrm must be object", value=data__qrm, name="" + (name_prefix or "data") + ".qrm", definition={'type': 'object', 'properties': {'documentation_home': {'type': 'string', 'description': 'Location of QRM documentation (e.g. URL of Pull Request, Network path of docx file)', 'minLength': 12}, 'primary_signer': {'description': 'Primary signer for this product component release; likely one of the primary authors as well.', 'oneOf': [{'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, {'type': 'string', 'enum': ['Cloud First Release - Find Primary Signer in QRM documentation home']}]}, 'peer_reviewer': {'description': 'Peer Reviewer for this product component release.', 'oneOf': [{'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, {'type': 'string', 'enum': ['Risk Level 2C - Peer Review not required', 'Cloud First Release - Find Peer Reviewer in QRM documentation home']}]}}, 'additionalProperties': False, 'required': ['documentation_home', 'primary_signer', 'peer_reviewer']}, rule='type')
+            data__qrm_is_dict = isinstance(data__qrm, dict)
+            if data__qrm_is_dict:
+                data__qrm__missing_keys = set(['documentation_home', 'primary_signer', 'peer_reviewer']) - data__qrm.keys()
+                if data__qrm__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".qrm must contain " + (str(sorted(data__qrm__missing_keys)) + " properties"), value=data__qrm, name="" + (name_prefix or "data") + ".qrm", definition={'type': 'object', 'properties': {'documentation_home': {'type': 'string', 'description': 'Location of QRM documentation (e.g. URL of Pull Request, Network path of docx file)', 'minLength': 12}, 'primary_signer': {'description': 'Primary signer for this product component release; likely one of the primary authors as well.', 'oneOf': [{'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, {'type': 'string', 'enum': ['Cloud First Release - Find Primary Signer in QRM documentation home']}]}, 'peer_reviewer': {'description': 'Peer Reviewer for this product component release.', 'oneOf': [{'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, {'type': 'string', 'enum': ['Risk Level 2C - Peer Review not required', 'Cloud First Release - Find Peer Reviewer in QRM documentation home']}]}}, 'additionalProperties': False, 'required': ['documentation_home', 'primary_signer', 'peer_reviewer']}, rule='required')
+                data__qrm_keys = set(data__qrm.keys())
+                if "documentation_home" in data__qrm_keys:
+                    data__qrm_keys.remove("documentation_home")
+                    data__qrm__documentationhome = data__qrm["documentation_home"]
+                    if not isinstance(data__qrm__documentationhome, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".qrm.documentation_home must be string", value=data__qrm__documentationhome, name="" + (name_prefix or "data") + ".qrm.documentation_home", definition={'type': 'string', 'description': 'Location of QRM documentation (e.g. URL of Pull Request, Network path of docx file)', 'minLength': 12}, rule='type')
+                    if isinstance(data__qrm__documentationhome, str):
+                        data__qrm__documentationhome_len = len(data__qrm__documentationhome)
+                        if data__qrm__documentationhome_len < 12:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".qrm.documentation_home must be longer than or equal to 12 characters", value=data__qrm__documentationhome, name="" + (name_prefix or "data") + ".qrm.documentation_home", definition={'type': 'string', 'description': 'Location of QRM documentation (e.g. URL of Pull Request, Network path of docx file)', 'minLength': 12}, rule='minLength')
+                if "primary_signer" in data__qrm_keys:
+                    data__qrm_keys.remove("primary_signer")
+                    data__qrm__primarysigner = data__qrm["primary_signer"]
+                    data__qrm__primarysigner_one_of_count1 = 0
+                    if data__qrm__primarysigner_one_of_count1 < 2:
+                        try:
+                            validate___definitions_authorized_qrm_signers(data__qrm__primarysigner, custom_formats, (name_prefix or "data") + ".qrm.primary_signer")
+                            data__qrm__primarysigner_one_of_count1 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                    if data__qrm__primarysigner_one_of_count1 < 2:
+                        try:
+                            if not isinstance(data__qrm__primarysigner, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".qrm.primary_signer must be string", value=data__qrm__primarysigner, name="" + (name_prefix or "data") + ".qrm.primary_signer", definition={'type': 'string', 'enum': ['Cloud First Release - Find Primary Signer in QRM documentation home']}, rule='type')
+                            if not (isinstance(data__qrm__primarysigner, str) and data__qrm__primarysigner == 'Cloud First Release - Find Primary Signer in QRM documentation home'):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".qrm.primary_signer must be one of ['Cloud First Release - Find Primary Signer in QRM documentation home']", value=data__qrm__primarysigner, name="" + (name_prefix or "data") + ".qrm.primary_signer", definition={'type': 'string', 'enum': ['Cloud First Release - Find Primary Signer in QRM documentation home']}, rule='enum')
+                            data__qrm__primarysigner_one_of_count1 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                    if data__qrm__primarysigner_one_of_count1 != 1:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".qrm.primary_signer must be valid exactly by one definition" + (" (" + str(data__qrm__primarysigner_one_of_count1) + " matches found)"), value=data__qrm__primarysigner, name="" + (name_prefix or "data") + ".qrm.primary_signer", definition={'description': 'Primary signer for this product component release; likely one of the primary authors as well.', 'oneOf': [{'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, {'type': 'string', 'enum': ['Cloud First Release - Find Primary Signer in QRM documentation home']}]}, rule='oneOf')
+                if "peer_reviewer" in data__qrm_keys:
+                    data__qrm_keys.remove("peer_reviewer")
+                    data__qrm__peerreviewer = data__qrm["peer_reviewer"]
+                    data__qrm__peerreviewer_one_of_count2 = 0
+                    if data__qrm__peerreviewer_one_of_count2 < 2:
+                        try:
+                            validate___definitions_authorized_qrm_signers(data__qrm__peerreviewer, custom_formats, (name_prefix or "data") + ".qrm.peer_reviewer")
+                            data__qrm__peerreviewer_one_of_count2 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                    if data__qrm__peerreviewer_one_of_count2 < 2:
+                        try:
+                            if not isinstance(data__qrm__peerreviewer, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".qrm.peer_reviewer must be string", value=data__qrm__peerreviewer, name="" + (name_prefix or "data") + ".qrm.peer_reviewer", definition={'type': 'string', 'enum': ['Risk Level 2C - Peer Review not required', 'Cloud First Release - Find Peer Reviewer in QRM documentation home']}, rule='type')
+                            if not (isinstance(data__qrm__peerreviewer, str) and data__qrm__peerreviewer == 'Risk Level 2C - Peer Review not required' or isinstance(data__qrm__peerreviewer, str) and data__qrm__peerreviewer == 'Cloud First Release - Find Peer Reviewer in QRM documentation home'):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".qrm.peer_reviewer must be one of ['Risk Level 2C - Peer Review not required', 'Cloud First Release - Find Peer Reviewer in QRM documentation home']", value=data__qrm__peerreviewer, name="" + (name_prefix or "data") + ".qrm.peer_reviewer", definition={'type': 'string', 'enum': ['Risk Level 2C - Peer Review not required', 'Cloud First Release - Find Peer Reviewer in QRM documentation home']}, rule='enum')
+                            data__qrm__peerreviewer_one_of_count2 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                    if data__qrm__peerreviewer_one_of_count2 != 1:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".qrm.peer_reviewer must be valid exactly by one definition" + (" (" + str(data__qrm__peerreviewer_one_of_count2) + " matches found)"), value=data__qrm__peerreviewer, name="" + (name_prefix or "data") + ".qrm.peer_reviewer", definition={'description': 'Peer Reviewer for this product component release.', 'oneOf': [{'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, {'type': 'string', 'enum': ['Risk Level 2C - Peer Review not required', 'Cloud First Release - Find Peer Reviewer in QRM documentation home']}]}, rule='oneOf')
+                if data__qrm_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".qrm must not contain "+str(data__qrm_keys)+" properties", value=data__qrm, name="" + (name_prefix or "data") + ".qrm", definition={'type': 'object', 'properties': {'documentation_home': {'type': 'string', 'description': 'Location of QRM documentation (e.g. URL of Pull Request, Network path of docx file)', 'minLength': 12}, 'primary_signer': {'description': 'Primary signer for this product component release; likely one of the primary authors as well.', 'oneOf': [{'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, {'type': 'string', 'enum': ['Cloud First Release - Find Primary Signer in QRM documentation home']}]}, 'peer_reviewer': {'description': 'Peer Reviewer for this product component release.', 'oneOf': [{'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, {'type': 'string', 'enum': ['Risk Level 2C - Peer Review not required', 'Cloud First Release - Find Peer Reviewer in QRM documentation home']}]}}, 'additionalProperties': False, 'required': ['documentation_home', 'primary_signer', 'peer_reviewer']}, rule='additionalProperties')
+        if "url_git_repo" in data_keys:
+            data_keys.remove("url_git_repo")
+            data__urlgitrepo = data["url_git_repo"]
+            if not isinstance(data__urlgitrepo, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".url_git_repo must be string", value=data__urlgitrepo, name="" + (name_prefix or "data") + ".url_git_repo", definition={'type': 'string', 'description': 'URL of the git repository for this product component. (Without `.git` ending)', 'minLength': 12}, rule='type')
+            if isinstance(data__urlgitrepo, str):
+                data__urlgitrepo_len = len(data__urlgitrepo)
+                if data__urlgitrepo_len < 12:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".url_git_repo must be longer than or equal to 12 characters", value=data__urlgitrepo, name="" + (name_prefix or "data") + ".url_git_repo", definition={'type': 'string', 'description': 'URL of the git repository for this product component. (Without `.git` ending)', 'minLength': 12}, rule='minLength')
+        if "path_qvws_git" in data_keys:
+            data_keys.remove("path_qvws_git")
+            data__pathqvwsgit = data["path_qvws_git"]
+            if not isinstance(data__pathqvwsgit, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".path_qvws_git must be string", value=data__pathqvwsgit, name="" + (name_prefix or "data") + ".path_qvws_git", definition={'type': 'string', 'description': 'Network path of compiled QVWs to use for development runs directly from git.', 'minLength': 12}, rule='type')
+            if isinstance(data__pathqvwsgit, str):
+                data__pathqvwsgit_len = len(data__pathqvwsgit)
+                if data__pathqvwsgit_len < 12:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".path_qvws_git must be longer than or equal to 12 characters", value=data__pathqvwsgit, name="" + (name_prefix or "data") + ".path_qvws_git", definition={'type': 'string', 'description': 'Network path of compiled QVWs to use for development runs directly from git.', 'minLength': 12}, rule='minLength')
+        if "explicit_python_subfolder" in data_keys:
+            data_keys.remove("explicit_python_subfolder")
+            data__explicitpythonsubfolder = data["explicit_python_subfolder"]
+            if not isinstance(data__explicitpythonsubfolder, (bool)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".explicit_python_subfolder must be boolean", value=data__explicitpythonsubfolder, name="" + (name_prefix or "data") + ".explicit_python_subfolder", definition={'type': 'boolean', 'description': 'Does this solution have an explicit python subfolder for its python library'}, rule='type')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/schema#', 'definitions': {'authorized_qrm_signers': {'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}}, 'type': 'object', 'properties': {'qrm': {'type': 'object', 'properties': {'documentation_home': {'type': 'string', 'description': 'Location of QRM documentation (e.g. URL of Pull Request, Network path of docx file)', 'minLength': 12}, 'primary_signer': {'description': 'Primary signer for this product component release; likely one of the primary authors as well.', 'oneOf': [{'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, {'type': 'string', 'enum': ['Cloud First Release - Find Primary Signer in QRM documentation home']}]}, 'peer_reviewer': {'description': 'Peer Reviewer for this product component release.', 'oneOf': [{'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, {'type': 'string', 'enum': ['Risk Level 2C - Peer Review not required', 'Cloud First Release - Find Peer Reviewer in QRM documentation home']}]}}, 'additionalProperties': False, 'required': ['documentation_home', 'primary_signer', 'peer_reviewer']}, 'url_git_repo': {'type': 'string', 'description': 'URL of the git repository for this product component. (Without `.git` ending)', 'minLength': 12}, 'path_qvws_git': {'type': 'string', 'description': 'Network path of compiled QVWs to use for development runs directly from git.', 'minLength': 12}, 'explicit_python_subfolder': {'type': 'boolean', 'description': 'Does this solution have an explicit python subfolder for its python library'}}, 'additionalProperties': False, 'required': ['qrm', 'url_git_repo']}, rule='additionalProperties')
+    return data
+
+def validate___definitions_authorized_qrm_signers(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (str)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, rule='type')
+    if not (isinstance(data, str) and data == 'shea.parkes@milliman.com' or isinstance(data, str) and data == 'kyle.baird@milliman.com' or isinstance(data, str) and data == 'michael.reisz@milliman.com' or isinstance(data, str) and data == 'jason.altieri@milliman.com' or isinstance(data, str) and data == 'rich.moyer@milliman.com' or isinstance(data, str) and data == 'jeremy.cunningham@milliman.com' or isinstance(data, str) and data == 'jonah.broulette@milliman.com' or isinstance(data, str) and data == 'michele.berrios@milliman.com' or isinstance(data, str) and data == 'ben.copeland@milliman.com' or isinstance(data, str) and data == 'kelsie.stevenson@milliman.com' or isinstance(data, str) and data == 'ben.wyatt@milliman.com' or isinstance(data, str) and data == 'noah.champagne@milliman.com' or isinstance(data, str) and data == 'tom.puckett@milliman.com' or isinstance(data, str) and data == 'matthew.hawthorne@milliman.com' or isinstance(data, str) and data == 'chas.busenburg@milliman.com' or isinstance(data, str) and data == 'pierre.cornell@milliman.com' or isinstance(data, str) and data == 'umang.gupta@milliman.com' or isinstance(data, str) and data == 'aaron.burgess@milliman.com' or isinstance(data, str) and data == 'ocean.liu@milliman.com' or isinstance(data, str) and data == 'thomas.klimek@milliman.com' or isinstance(data, str) and data == 'sam.miller@milliman.com' or isinstance(data, str) and data == 'ledjon.ceca@milliman.com'):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be one of ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'string', 'enum': ['shea.parkes@milliman.com', 'kyle.baird@milliman.com', 'michael.reisz@milliman.com', 'jason.altieri@milliman.com', 'rich.moyer@milliman.com', 'jeremy.cunningham@milliman.com', 'jonah.broulette@milliman.com', 'michele.berrios@milliman.com', 'ben.copeland@milliman.com', 'kelsie.stevenson@milliman.com', 'ben.wyatt@milliman.com', 'noah.champagne@milliman.com', 'tom.puckett@milliman.com', 'matthew.hawthorne@milliman.com', 'chas.busenburg@milliman.com', 'pierre.cornell@milliman.com', 'umang.gupta@milliman.com', 'aaron.burgess@milliman.com', 'ocean.liu@milliman.com', 'thomas.klimek@milliman.com', 'sam.miller@milliman.com', 'ledjon.ceca@milliman.com']}, rule='enum')
+    return data
\ No newline at end of file
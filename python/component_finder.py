@@ -9,22 +9,53 @@
 """
 # pylint: disable=line-too-long
 import os
+import re
+import stat
 import logging
 import json
+import hashlib
 import typing
 import functools
 import contextlib
 import datetime
-import collections
+import concurrent.futures
+import urllib.parse
 from pathlib import Path
 
 import jsonschema
 from semantic_version import Version
-from yarl import URL
+try:
+    import fastjsonschema
+    compile_schema = fastjsonschema.compile # pylint: disable=invalid-name
+    ERRORS_COMPILED_SCHEMA = (fastjsonschema.JsonSchemaException,)
+except ImportError: # Still build the (slower) validator only once
+    def compile_schema(schema):
+        """Build a reusable stdlib-only validator"""
+        return jsonschema.Draft7Validator(schema).validate
+    ERRORS_COMPILED_SCHEMA = () # jsonschema raises ValidationError itself
+try:
+    import orjson
+    loads_json = orjson.loads # pylint: disable=invalid-name
+except ImportError:
+    loads_json = json.loads # pylint: disable=invalid-name
 
 LOGGER = logging.getLogger(__name__)
 with (Path(__file__).parent / 'release-schema.json').open() as fh_schema:
     SCHEMA_RELEASE = json.load(fh_schema)
+DIGEST_SCHEMA_RELEASE = hashlib.sha256(json.dumps(SCHEMA_RELEASE, sort_keys=True).encode('utf-8')).hexdigest()
+try:
+    import _release_schema_validator # Pre-compiled by `tools/generate_validator.py`
+except ImportError:
+    _release_schema_validator = None # pylint: disable=invalid-name
+if _release_schema_validator and _release_schema_validator.SCHEMA_DIGEST == DIGEST_SCHEMA_RELEASE:
+    VALIDATE_RELEASE = _release_schema_validator.validate
+else:
+    VALIDATE_RELEASE = compile_schema(SCHEMA_RELEASE)
+CACHE_RELEASE_JSON: typing.Dict[Path, typing.Tuple[typing.Tuple[int, int], dict]] = {}
+VALIDATED_RELEASE_PAYLOADS: typing.Set[str] = set()
+MAX_VALIDATED_RELEASE_PAYLOADS = 256
+PATTERN_RELEASE_FOLDER = re.compile(r'v?\d+\.\d+\.\d+')
+PATTERN_PLAIN_VERSION = re.compile(r'v?(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)') # No prerelease/build; sorts as an int tuple
 BATCH_LOGGER_PREFIX = 'echo %~nx0 %DATE:~-4%-%DATE:~4,2%-%DATE:~7,2% %TIME%'
 
 # =============================================================================
@@ -32,9 +63,42 @@ BATCH_LOGGER_PREFIX = 'echo %~nx0 %DATE:~-4%-%DATE:~4,2%-%DATE:~7,2% %TIME%'
 # =============================================================================
 
 
+def get_repo_name(url_git_repo: str) -> str:
+    """Get the last path segment of a git URL (empty if it ends with a slash)"""
+    return urllib.parse.unquote(urllib.parse.urlsplit(url_git_repo).path.rsplit('/', 1)[-1])
+
+
+def recompile_release_schema() -> None:
+    """Regenerate the compiled validator (needed after any mutation of SCHEMA_RELEASE)"""
+    global VALIDATE_RELEASE # pylint: disable=global-statement
+    VALIDATE_RELEASE = compile_schema(SCHEMA_RELEASE)
+    VALIDATED_RELEASE_PAYLOADS.clear()
+    CACHE_RELEASE_JSON.clear()
+
+
 def validate_release_schema(release) -> None:
     """Validate a candidate release against the anticipated schema."""
-    jsonschema.validate(release, SCHEMA_RELEASE)
+    try:
+        # Stdlib rather than orjson: it refuses datetimes/UUIDs/dataclasses instead of quietly stringifying them
+        payload = json.dumps(release, sort_keys=True)
+    except (TypeError, ValueError): # Anything without a faithful JSON form just skips the memo
+        payload = None
+    if payload is not None and payload in VALIDATED_RELEASE_PAYLOADS:
+        return None
+    _validate_release(release) # Always the caller's object; the payload is only a memo key
+    if payload is not None:
+        if len(VALIDATED_RELEASE_PAYLOADS) >= MAX_VALIDATED_RELEASE_PAYLOADS:
+            VALIDATED_RELEASE_PAYLOADS.clear()
+        VALIDATED_RELEASE_PAYLOADS.add(payload)
+    return None
+
+
+def _validate_release(release) -> None:
+    """Run the schema and the extra QRM/git checks against a release"""
+    try:
+        VALIDATE_RELEASE(release)
+    except ERRORS_COMPILED_SCHEMA as err:
+        raise jsonschema.ValidationError(err.message) from err
     if release['qrm']['primary_signer'] == release['qrm']['peer_reviewer']:
         raise jsonschema.ValidationError(
             'Primary Signer and Peer Reviewer cannot both be {}'.format(
@@ -42,8 +106,8 @@ def validate_release_schema(release) -> None:
             )
         )
 
-    _url_git_repo = URL(release['url_git_repo'])
-    _repo_name = _url_git_repo.name
+    _url_git_repo = release['url_git_repo']
+    _repo_name = get_repo_name(_url_git_repo)
     if not _repo_name:
         raise jsonschema.ValidationError(
             '{} is likely ending with a front slash and should not'.format(_url_git_repo)
@@ -56,6 +120,24 @@ def validate_release_schema(release) -> None:
     return None
 
 
+def load_release_json(path_release: Path) -> dict:
+    """Load (and validate) the release.json of a release folder, reusing prior loads of an unchanged file"""
+    path_release_json = path_release / 'release.json'
+    try:
+        _stat = path_release_json.stat()
+    except OSError:
+        _stat = None
+    assert _stat and stat.S_ISREG(_stat.st_mode), '{} does not exist'.format(path_release_json)
+    _signature = (_stat.st_mtime_ns, _stat.st_size)
+    _cached = CACHE_RELEASE_JSON.get(path_release_json)
+    if _cached and _cached[0] == _signature:
+        return _cached[1]
+    _release_json = loads_json(path_release_json.read_bytes())
+    validate_release_schema(_release_json)
+    CACHE_RELEASE_JSON[path_release_json] = (_signature, _release_json)
+    return _release_json
+
+
 @functools.total_ordering
 class Release():
     """Class to encapsulate the fun of a release"""
@@ -65,34 +147,73 @@ class Release():
         if not path.is_dir():
             raise ValueError('{} is not a directory')
         self.path = path
-        self.version = Version(self.path.name.strip('v'))
-        self._release_json = None # Lazily loaded for backward compatibility
+        self._check_version()
 
-    @property
-    def release_json(self):
+    @classmethod
+    def try_build(cls, path: Path, verified_dir: bool=False) -> typing.Optional['Release']:
+        """Build a Release if `path` looks like one, otherwise return None (cheaper than raising while scanning)"""
+        if not PATTERN_RELEASE_FOLDER.match(path.name):
+            return None
+        if not verified_dir and not path.is_dir():
+            return None
+        release = cls.__new__(cls)
+        release.path = path
+        try:
+            release._check_version()
+        except ValueError:
+            return None
+        return release
+
+    def _check_version(self) -> None:
+        """Raise ValueError unless the folder name is a version (plain ones skip the semver parse)"""
+        if self._version_key is None:
+            _ = self.version
+
+    @functools.cached_property
+    def _version_key(self) -> typing.Optional[typing.Tuple[int, int, int]]:
+        """Cheap (major, minor, patch) for plain version folders; None when full semver rules are needed"""
+        match = PATTERN_PLAIN_VERSION.fullmatch(self.path.name)
+        return (int(match[1]), int(match[2]), int(match[3])) if match else None
+
+    @functools.cached_property
+    def version(self) -> Version:
+        """Lazily parse the version out of the folder name"""
+        return Version(self.path.name.strip('v'))
+
+    @functools.cached_property
+    def release_json(self) -> dict:
         """Lazily load (and validate) the accompanying release.json"""
-        if self._release_json:
-            return self._release_json
-        else:
-            path_release_json = self.path / 'release.json'
-            assert path_release_json.is_file(), '{} does not exist'.format(path_release_json)
-            with path_release_json.open() as fh_json:
-                self._release_json = json.load(fh_json)
-            validate_release_schema(self._release_json)
-            return self._release_json
+        return load_release_json(self.path)
+
+    @functools.cached_property
+    def _version_parts(self) -> typing.Tuple[int, int, int, typing.Tuple[str, ...], typing.Tuple[str, ...]]:
+        """(major, minor, patch, prerelease, build), without building a Version for plain version folders"""
+        if self._version_key is not None:
+            return (*self._version_key, (), ())
+        return (self.version.major, self.version.minor, self.version.patch, self.version.prerelease, self.version.build)
 
-    def __getattr__(self, name):
-        """Pass through to embedded Version class"""
-        return getattr(self.version, name)
+    major = property(lambda self: self._version_parts[0], doc='Major version number')
+    minor = property(lambda self: self._version_parts[1], doc='Minor version number')
+    patch = property(lambda self: self._version_parts[2], doc='Patch version number')
+    prerelease = property(lambda self: self._version_parts[3], doc='Prerelease identifiers (empty for real releases)')
+    build = property(lambda self: self._version_parts[4], doc='Build metadata identifiers')
 
     def __eq__(self, other):
         """Compare on version"""
+        if self._version_key is not None and other._version_key is not None:
+            return self._version_key == other._version_key
         return self.version == other.version
 
     def __lt__(self, other):
         """Sort on version"""
+        if self._version_key is not None and other._version_key is not None:
+            return self._version_key < other._version_key
         return self.version < other.version
 
+    def __hash__(self):
+        """Hash on the version core, which any two equal releases share (and plain folders get cheaply)"""
+        return hash((self.major, self.minor, self.patch))
+
     def __repr__(self):
         """A pretty stringifyier"""
         return "Release(component_name={}, version={}, path={})".format(
@@ -101,22 +222,22 @@ class Release():
             self.path,
         )
 
-    @property
+    @functools.cached_property
     def component_name(self):
         """Dig out the component name from the path."""
         return self.path.parent.name.lower()
 
-    @property
-    def url_git_repo(self) -> URL:
+    @functools.cached_property
+    def url_git_repo(self) -> str:
         """Where the code for the component likely lives"""
-        return URL(self.release_json['url_git_repo'])
+        return self.release_json['url_git_repo']
 
-    @property
+    @functools.cached_property
     def name_git_repo(self) -> str:
         """Get the name of the git repo for this component"""
-        return self.url_git_repo.name.lower()
+        return get_repo_name(self.url_git_repo).lower()
 
-    @property
+    @functools.cached_property
     def path_qvws_git(self) -> typing.Optional[Path]:
         """Lazily provide the path to compiled QVWs for use with checked out code"""
         try:
@@ -127,7 +248,7 @@ class Release():
         except KeyError:
             return None
 
-    @property
+    @functools.cached_property
     def explicit_python_subfolder(self) -> bool:
         """Does the release include an explicit python subfolder"""
         try:
@@ -137,262 +258,255 @@ class Release():
 
     def generate_setup_env_code(self, base_env: bool=False) -> 'typing.List[str]':
         """Generate the code to setup environment variables for this component"""
+        name = self.component_name
+        name_upper = name.upper()
+        sep = os.path.sep
+        qrm = self.release_json['qrm']
         _code = []
-        _code.append(
-            '{}: Setting up environment variables for: {}'.format(
-                BATCH_LOGGER_PREFIX,
-                self.component_name.upper(),
-            )
-        )
-        _code.append('rem Component: {}    Current Version: {}'.format(
-            self.component_name,
-            self.version,
-        ))
-        _code.append('rem Primary Signer: {}    Peer Reviewer: {}'.format(
-            self.release_json['qrm']['primary_signer'],
-            self.release_json['qrm']['peer_reviewer'],
-        ))
-        _code.append('rem QRM Documentation: {}'.format(
-            self.release_json['qrm']['documentation_home'],
-        ))
+        _code.append(f'{BATCH_LOGGER_PREFIX}: Setting up environment variables for: {name_upper}')
+        _code.append(f'rem Component: {name}    Current Version: {self.version}')
+        _code.append(f'rem Primary Signer: {qrm["primary_signer"]}    Peer Reviewer: {qrm["peer_reviewer"]}')
+        _code.append(f'rem QRM Documentation: {qrm["documentation_home"]}')
         if base_env:
-            _code.append('SET PRM_COMPONENTS={}'.format(self.component_name.upper()))
+            _code.append(f'SET PRM_COMPONENTS={name_upper}')
         else:
-            _code.append(
-                'SET PRM_COMPONENTS=%PRM_COMPONENTS%;{}'.format(self.component_name.upper())
-            )
-        _code.append('IF %{}_FROMGIT% EQU FALSE ('.format(self.component_name.upper()))
-        _code.append('  SET {0}_SOURCE={1}{2}%{0}_VERSION%{2}'.format(
-            self.component_name.upper(),
-            self.path.parent,
-            os.path.sep,
-        ))
-        _code.append('  SET {0}_HOME=%LOCAL_COMPONENT_SOURCE%{2}{0}{2}%{0}_VERSION%{2}'.format(
-            self.component_name.upper(),
-            self.path.parent,
-            os.path.sep,
-        ))
+            _code.append(f'SET PRM_COMPONENTS=%PRM_COMPONENTS%;{name_upper}')
+        _code.append(f'IF %{name_upper}_FROMGIT% EQU FALSE (')
+        _code.append(f'  SET {name_upper}_SOURCE={self.path.parent}{sep}%{name_upper}_VERSION%{sep}')
+        _code.append(f'  SET {name_upper}_HOME=%LOCAL_COMPONENT_SOURCE%{sep}{name_upper}{sep}%{name_upper}_VERSION%{sep}')
         _code.append(') ELSE (')
-        _code.append('  SET {}_HOME=%UserProfile%\\repos\\{}{}'.format(
-            self.component_name.upper(),
-            self.name_git_repo,
-            os.path.sep,
-        ))
-        _code.append('  SET {}_VERSION=git'.format(
-            self.component_name.upper(),
-        ))
+        _code.append(f'  SET {name_upper}_HOME=%UserProfile%\\repos\\{self.name_git_repo}{sep}')
+        _code.append(f'  SET {name_upper}_VERSION=git')
         _code.append(')')
-        _code.append('IF %{}_FROMGIT% EQU FALSE ('.format(self.component_name.upper()))
-        _code.append('  call %BASE_ENV_{1}%copy_directory.bat %{0}_SOURCE% %{0}_HOME%'.format(
-            self.component_name.upper(),
-            'SOURCE' if base_env else 'HOME',
-        ))
+        _code.append(f'IF %{name_upper}_FROMGIT% EQU FALSE (')
+        _code.append(f'  call %BASE_ENV_{"SOURCE" if base_env else "HOME"}%copy_directory.bat %{name_upper}_SOURCE% %{name_upper}_HOME%')
         _code.append(')')
         if not base_env:
-            _code.append('IF %{}_FROMGIT% EQU FALSE ('.format(self.component_name.upper()))
-            _code.append('  SET {0}_PATHREF=%{0}_HOME%_compiled_reference_data{1}'.format(
-                self.component_name.upper(),
-                os.path.sep,
-            ))
+            _code.append(f'IF %{name_upper}_FROMGIT% EQU FALSE (')
+            _code.append(f'  SET {name_upper}_PATHREF=%{name_upper}_HOME%_compiled_reference_data{sep}')
             _code.append(') ELSE (')
             _code.append('  IF %_PRM_INTEGRATION_TESTING_SETUP_REFDATA% EQU TRUE (')
-            _code.append('    CALL :{}_PATHREF_GIT_SETUP'.format(self.component_name.upper()))
+            _code.append(f'    CALL :{name_upper}_PATHREF_GIT_SETUP')
             _code.append('  )')
             _code.append(')')
 
-        _code.append('SET {}_URL_GIT={}'.format(
-            self.component_name.upper(),
-            self.url_git_repo,
-        ))
+        _code.append(f'SET {name_upper}_URL_GIT={self.url_git_repo}')
         if not base_env: # `base_env.bat` seeds %PYTHONPATH%
-            _code.append(f'SET {self.component_name.upper()}_EXPLICIT_PYTHON={self.explicit_python_subfolder}')
-            _code.append('SET PYTHONPATH=%PYTHONPATH%;%{}_HOME%{}'.format(
-                self.component_name.upper(),
-                'python' if self.explicit_python_subfolder else ''
-            ))
-        if self.path_qvws_git:
-            _code.append('SET {}_GIT_QVW_PATH={}{}'.format(
-                self.component_name.upper(),
-                self.path_qvws_git,
-                os.path.sep,
-            ))
-        _code.append(
-            '{0}: {1}_HOME was set to %{1}_HOME%'.format(
-                BATCH_LOGGER_PREFIX,
-                self.component_name.upper(),
-            )
-        )
+            explicit_python_subfolder = self.explicit_python_subfolder
+            _code.append(f'SET {name_upper}_EXPLICIT_PYTHON={explicit_python_subfolder}')
+            _code.append(f'SET PYTHONPATH=%PYTHONPATH%;%{name_upper}_HOME%{"python" if explicit_python_subfolder else ""}')
+        path_qvws_git = self.path_qvws_git
+        if path_qvws_git:
+            _code.append(f'SET {name_upper}_GIT_QVW_PATH={path_qvws_git}{sep}')
+        _code.append(f'{BATCH_LOGGER_PREFIX}: {name_upper}_HOME was set to %{name_upper}_HOME%')
         return _code
 
     def generate_subroutines(self) -> 'typing.List[str]':
         """Generate the subroutines needed to deal with scoping and escaping"""
+        name_upper = self.component_name.upper()
+        sep = os.path.sep
         _code = []
-        _code.append(':{}_PATHREF_GIT_SETUP'.format(self.component_name.upper()))
-        _code.append('SET {0}_PATHREF=%_PRM_INTEGRATION_TESTING_DATA_DRIVE%%_PATH_PIPELINE_COMPONENTS_ENV:~1%{1}_testing_refdata{1}{0}{1}'.format(
-            self.component_name.upper(),
-            os.path.sep,
-        ))
-        _code.append('IF NOT EXIST "%{}_PATHREF%" ('.format(self.component_name.upper()))
-        _code.append('  CALL :{}_PATHREF_GIT_CREATE'.format(self.component_name.upper()))
+        _code.append(f':{name_upper}_PATHREF_GIT_SETUP')
+        _code.append(f'SET {name_upper}_PATHREF=%_PRM_INTEGRATION_TESTING_DATA_DRIVE%%_PATH_PIPELINE_COMPONENTS_ENV:~1%{sep}_testing_refdata{sep}{name_upper}{sep}')
+        _code.append(f'IF NOT EXIST "%{name_upper}_PATHREF%" (')
+        _code.append(f'  CALL :{name_upper}_PATHREF_GIT_CREATE')
         _code.append(')')
         _code.append('GOTO :eof')
         _code.append('')
-        _code.append(':{}_PATHREF_GIT_CREATE'.format(self.component_name.upper()))
-        _code.append('{0}: Creating new folder for {1}_PATHREF=%{1}_PATHREF%'.format(
-            BATCH_LOGGER_PREFIX,
-            self.component_name.upper(),
-        ))
-        _code.append('MKDIR "%{}_PATHREF%"'.format(self.component_name.upper()))
+        _code.append(f':{name_upper}_PATHREF_GIT_CREATE')
+        _code.append(f'{BATCH_LOGGER_PREFIX}: Creating new folder for {name_upper}_PATHREF=%{name_upper}_PATHREF%')
+        _code.append(f'MKDIR "%{name_upper}_PATHREF%"')
         _code.append('GOTO :eof')
 
         return _code
 
 
+def _pick_current_release(entries: typing.Iterable[os.DirEntry], paths_release: typing.Optional[typing.Set[str]]=None) -> typing.Optional[Release]:
+    """Pick the current release out of already listed folder entries (noting every release folder in `paths_release`)"""
+    current = None
+    for entry in entries:
+        if not PATTERN_RELEASE_FOLDER.match(entry.name) or not entry.is_dir():
+            continue
+        version = Release.try_build(Path(entry.path), verified_dir=True)
+        if version and paths_release is not None:
+            paths_release.add(entry.path)
+        if version and not version.prerelease and (current is None or version > current):
+            current = version
+
+    return current
+
+
 def find_current_release(path: Path) -> typing.Optional[Release]:
     """Find the current release from a folder of releases"""
-    releases = []
-    with contextlib.suppress(OSError):
-        for possible_release in path.glob('*'):
-            with contextlib.suppress(ValueError):
-                version = Release(possible_release)
-                if not version.prerelease:
-                    releases.append(version)
-
-    if releases:
-        releases.sort()
-        return releases[-1]
-    else:
-        return None
+    with contextlib.suppress(OSError), os.scandir(path) as entries:
+        return _pick_current_release(entries)
+    return None
+
+
+def normalize_path(path: typing.Union[str, Path]) -> str:
+    """Cheaply normalize a path for identity checks (no file system access)"""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def scan_components(root_path: Path, executor: typing.Optional[concurrent.futures.Executor]=None, skip_paths: typing.AbstractSet[str]=frozenset()) -> typing.Iterator[typing.Tuple[str, Release]]:
+    """Yield (component name, current release) for a root folder and each of its component subfolders (minus any `skip_paths`)"""
+    entries = []
+    with contextlib.suppress(OSError), os.scandir(root_path) as _entries:
+        entries = [entry for entry in _entries if entry.is_dir()]
+
+    # The single listing above covers releases sitting directly in the root...
+    paths_release = set()
+    release = _pick_current_release(entries, paths_release)
+    if release:
+        yield root_path.name.lower(), release
+
+    # ...and the component folders, without descending into the release folders themselves
+    subdirs = [
+        Path(entry.path)
+        for entry in entries
+        if entry.path not in paths_release and normalize_path(entry.path) not in skip_paths
+    ]
+    _map = executor.map if executor else map
+    for subdir, release in zip(subdirs, _map(find_current_release, subdirs)):
+        if release:
+            yield subdir.name.lower(), release
 
 
 def main(root_paths: typing.List[Path]) -> int:
     """Do the real work"""
     LOGGER.info('Going to assemble a new `pipeline_components_env.bat`')
+    timestamp = datetime.datetime.now()
+    user_name = os.environ['UserName'] # Looked up front so a bad environment fails before the slow scan
 
     components = {}
-    for root_path in root_paths:
-        LOGGER.info('Scanning for product components here: %s', root_path)
-        release = find_current_release(root_path)
-        if release:
-            LOGGER.info('Found %s', release)
-            components[root_path.name.lower()] = release
-        for subdir in root_path.glob('*'):
-            if not subdir.is_dir():
-                continue
-            release = find_current_release(subdir)
-            if not release:
+    # Roots nested in other roots are only scanned as roots; repeated roots only once
+    paths_root = {normalize_path(root_path) for root_path in root_paths}
+    paths_scanned = set()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+        for root_path in root_paths:
+            if normalize_path(root_path) in paths_scanned:
+                LOGGER.info('Already scanned %s', root_path)
                 continue
-            LOGGER.info('Found %s', release)
-            components[subdir.name.lower()] = release
-
-    components_ordered = collections.OrderedDict(sorted(
-        components.items(),
-        key=lambda item: item[0],
-    ))
-    components_ordered.move_to_end('base_env', last=False)
+            paths_scanned.add(normalize_path(root_path))
+            LOGGER.info('Scanning for product components here: %s', root_path)
+            # Network share latency dominates here, so overlap the per-folder scans
+            for name_component, release in scan_components(root_path, executor, paths_root):
+                LOGGER.info('Found %s', release)
+                components[name_component] = release
+        # Likewise overlap reading (and validating) each current release.json
+        releases = list(components.values())
+        for release, release_json in zip(releases, executor.map(load_release_json, [release.path for release in releases])):
+            release.release_json = release_json # Seed the cached value
+
+    base_env_release = components.pop('base_env')
+    components_ordered = [components[name] for name in sorted(components)]
 
     name_output = 'pipeline_components_env-{}.bat'.format(
-        datetime.datetime.now().strftime('%Y-%m-%d'),
+        timestamp.strftime('%Y-%m-%d'),
     )
     LOGGER.info('Writing setup code into %s', name_output)
-    with open(name_output, 'w') as fh_out:
-        fh_out.write('@echo off\n')
-        fh_out.write('rem Auto-generated on {} by {}\n\n'.format(
-            datetime.datetime.now(),
-            os.environ['UserName'],
+    _lines = []
+    _lines.append('@echo off\n')
+    _lines.append('rem Auto-generated on {} by {}\n\n'.format(
+        timestamp,
+        user_name,
+    ))
+    _lines.append('rem Objective: Setup comprehensive environment for PRM pipeline work\n\n')
+    _lines.append('rem Developer Notes:\n')
+    _lines.append('rem   Normally intended to ultimately reside in a deliverable folder (i.e. next to `open_prm.bat`)\n')
+    _lines.append('rem   However, sometimes this will be called directly from its promoted location.\n')
+    _lines.append('rem   Many duplicate IF blocks exist below because we cannot EnableDelayedExpansion.\n')
+    _lines.append('rem   Subroutines exist below because project paths may have parentheses.\n\n\n')
+
+    _lines.append('rem #########################\n')
+    _lines.append('rem #### Version Toggles ####\n')
+    _lines.append('rem   Make edits here to change component versions\n\n')
+    for component in [base_env_release] + components_ordered:
+        _lines.append('SET {}_VERSION={}\n'.format(
+            component.component_name.upper(),
+            component.path.name,
+        ))
+    _lines.append('\nrem #### \\Version Toggles ###\n')
+    _lines.append('rem #########################\n\n\n')
+
+    _lines.append('rem #########################\n')
+    _lines.append('rem #### Testing Toggles ####\n')
+    _lines.append('rem   Make edits here to enable integration tests\n')
+    _lines.append('rem   Enabling any of these will supercede the version choice above\n\n')
+    for component in [base_env_release] + components_ordered:
+        _lines.append('SET {}_FROMGIT=FALSE\n'.format(
+            component.component_name.upper(),
         ))
-        fh_out.write('rem Objective: Setup comprehensive environment for PRM pipeline work\n\n')
-        fh_out.write('rem Developer Notes:\n')
-        fh_out.write('rem   Normally intended to ultimately reside in a deliverable folder (i.e. next to `open_prm.bat`)\n')
-        fh_out.write('rem   However, sometimes this will be called directly from its promoted location.\n')
-        fh_out.write('rem   Many duplicate IF blocks exist below because we cannot EnableDelayedExpansion.\n')
-        fh_out.write('rem   Subroutines exist below because project paths may have parentheses.\n\n\n')
-
-        fh_out.write('rem #########################\n')
-        fh_out.write('rem #### Version Toggles ####\n')
-        fh_out.write('rem   Make edits here to change component versions\n\n')
-        for component in components_ordered.values():
-            fh_out.write('SET {}_VERSION={}\n'.format(
-                component.component_name.upper(),
-                component.path.name,
-            ))
-        fh_out.write('\nrem #### \\Version Toggles ###\n')
-        fh_out.write('rem #########################\n\n\n')
-
-        fh_out.write('rem #########################\n')
-        fh_out.write('rem #### Testing Toggles ####\n')
-        fh_out.write('rem   Make edits here to enable integration tests\n')
-        fh_out.write('rem   Enabling any of these will supercede the version choice above\n\n')
-        for component in components_ordered.values():
-            fh_out.write('SET {}_FROMGIT=FALSE\n'.format(
-                component.component_name.upper(),
-            ))
-        fh_out.write('\nrem ## This block guides reference data locations during integration tests\n')
-        fh_out.write('SET _PRM_INTEGRATION_TESTING_DATA_DRIVE=K\n')
-        fh_out.write('SET _PATH_PIPELINE_COMPONENTS_ENV=%~dp0%\n')
-        fh_out.write('IF %_PATH_PIPELINE_COMPONENTS_ENV:~3,3% EQU PHI (\n')
-        fh_out.write('  SET _PRM_INTEGRATION_TESTING_SETUP_REFDATA=TRUE\n')
-        fh_out.write(') else (\n')
-        fh_out.write('  SET _PRM_INTEGRATION_TESTING_SETUP_REFDATA=FALSE\n')
-        fh_out.write(')\n\n')
-        fh_out.write('rem #### \\Testing Toggles ###\n')
-        fh_out.write('rem #########################\n\n\n')
-
-
-        fh_out.write(BATCH_LOGGER_PREFIX + ': Setting up full pipeline environment.\n')
-        fh_out.write(BATCH_LOGGER_PREFIX + ': Running from %~f0\n\n\n')
-
-        fh_out.write('SET LOCAL_COMPONENT_SOURCE=%UserProfile%\prm_local\components\n')
-        fh_out.write('IF not exist %LOCAL_COMPONENT_SOURCE% mkdir %LOCAL_COMPONENT_SOURCE%\n\n')
-
-        base_env_release = components_ordered.pop('base_env')
-        LOGGER.info('Beginning special treatment of %s', base_env_release)
-        for line in base_env_release.generate_setup_env_code(base_env=True):
-            fh_out.write('' + line + '\n')
-        fh_out.write('\nrem Calling embedded `base_env.bat`\n')
-        fh_out.write('rem   This will seed some accumulators (e.g. PYTHONPATH)\n')
-        fh_out.write(BATCH_LOGGER_PREFIX + ': Calling appropriate base_env.bat\n')
-        fh_out.write('call %BASE_ENV_HOME%base_env.bat\n\n\n')
-        LOGGER.info('Finished special treatment of %s', base_env_release)
-
-        for component in components_ordered.values():
-            LOGGER.info('Generating setup code for %s', component)
-            for line in component.generate_setup_env_code():
-                fh_out.write(line + '\n')
-            fh_out.write('\n\n')
-
-        LOGGER.info('Adding an entry for a client specific library')
-        fh_out.write('rem Include any client-specific python libraries\n')
-        fh_out.write(BATCH_LOGGER_PREFIX + ': Adding PythonPath entry for any client-specific python libraries\n')
-        fh_out.write('SET PYTHONPATH=%PYTHONPATH%;%~dp0\\01_Programs\\python\n\n\n')
-
-        LOGGER.info('Adding an entry for any client-specific environment scripts')
-        fh_out.write('rem Include any client-specific environment definitions\n')
-        fh_out.write(BATCH_LOGGER_PREFIX + ': Running any client-specific environment scripts\n')
-        fh_out.write('if exist "%~dp0\\01_Programs\\client_env.bat" (\n')
-        fh_out.write('  call "%~dp0\\01_Programs\\client_env.bat" (\n')
-        fh_out.write(')\n')
-        fh_out.write(BATCH_LOGGER_PREFIX + ': Finished running any client-specific environment scripts.\n\n\n')
-
-        LOGGER.info('Copying client-specific programs locally')
-        fh_out.write('rem Copying client-specific programs locally\n')
-        fh_out.write('if exist %LOCAL_COMPONENT_SOURCE%\project (\n')
-        fh_out.write('  RD /S /Q %LOCAL_COMPONENT_SOURCE%\project\n')
-        fh_out.write(')\n\n')
-        fh_out.write('if exist "%~dp0\\01_Programs\\" (\n')
-        fh_out.write('  call %BASE_ENV_HOME%copy_directory.bat %~dp0\\01_Programs\\ %LOCAL_COMPONENT_SOURCE%\project\\\n')
-        fh_out.write(')\n')
-        fh_out.write(BATCH_LOGGER_PREFIX + ': Finished copying any client-specific programs.\n')
-
-        fh_out.write(BATCH_LOGGER_PREFIX + ': Finished setting up full pipeline environment.\n\n')
-        fh_out.write('GOTO :eof\n\n\n')
-
-        fh_out.write('rem Define component-specific subroutines for scoping purposes\n\n')
-        for component in components_ordered.values():
-            LOGGER.info('Generating subroutines for %s', component)
-            for line in component.generate_subroutines():
-                fh_out.write(line + '\n')
-            fh_out.write('\n\n')
+    _lines.append('\nrem ## This block guides reference data locations during integration tests\n')
+    _lines.append('SET _PRM_INTEGRATION_TESTING_DATA_DRIVE=K\n')
+    _lines.append('SET _PATH_PIPELINE_COMPONENTS_ENV=%~dp0%\n')
+    _lines.append('IF %_PATH_PIPELINE_COMPONENTS_ENV:~3,3% EQU PHI (\n')
+    _lines.append('  SET _PRM_INTEGRATION_TESTING_SETUP_REFDATA=TRUE\n')
+    _lines.append(') else (\n')
+    _lines.append('  SET _PRM_INTEGRATION_TESTING_SETUP_REFDATA=FALSE\n')
+    _lines.append(')\n\n')
+    _lines.append('rem #### \\Testing Toggles ###\n')
+    _lines.append('rem #########################\n\n\n')
+
+
+    _lines.append(BATCH_LOGGER_PREFIX + ': Setting up full pipeline environment.\n')
+    _lines.append(BATCH_LOGGER_PREFIX + ': Running from %~f0\n\n\n')
+
+    _lines.append('SET LOCAL_COMPONENT_SOURCE=%UserProfile%\prm_local\components\n')
+    _lines.append('IF not exist %LOCAL_COMPONENT_SOURCE% mkdir %LOCAL_COMPONENT_SOURCE%\n\n')
+
+    LOGGER.info('Beginning special treatment of %s', base_env_release)
+    _lines.append('\n'.join(base_env_release.generate_setup_env_code(base_env=True)) + '\n')
+    _lines.append('\nrem Calling embedded `base_env.bat`\n')
+    _lines.append('rem   This will seed some accumulators (e.g. PYTHONPATH)\n')
+    _lines.append(BATCH_LOGGER_PREFIX + ': Calling appropriate base_env.bat\n')
+    _lines.append('call %BASE_ENV_HOME%base_env.bat\n\n\n')
+    LOGGER.info('Finished special treatment of %s', base_env_release)
+
+    for component in components_ordered:
+        LOGGER.info('Generating setup code for %s', component)
+        _lines.append('\n'.join(component.generate_setup_env_code()) + '\n\n\n')
+
+    LOGGER.info('Adding an entry for a client specific library')
+    _lines.append('rem Include any client-specific python libraries\n')
+    _lines.append(BATCH_LOGGER_PREFIX + ': Adding PythonPath entry for any client-specific python libraries\n')
+    _lines.append('SET PYTHONPATH=%PYTHONPATH%;%~dp0\\01_Programs\\python\n\n\n')
+
+    LOGGER.info('Adding an entry for any client-specific environment scripts')
+    _lines.append('rem Include any client-specific environment definitions\n')
+    _lines.append(BATCH_LOGGER_PREFIX + ': Running any client-specific environment scripts\n')
+    _lines.append('if exist "%~dp0\\01_Programs\\client_env.bat" (\n')
+    _lines.append('  call "%~dp0\\01_Programs\\client_env.bat" (\n')
+    _lines.append(')\n')
+    _lines.append(BATCH_LOGGER_PREFIX + ': Finished running any client-specific environment scripts.\n\n\n')
+
+    LOGGER.info('Copying client-specific programs locally')
+    _lines.append('rem Copying client-specific programs locally\n')
+    _lines.append('if exist %LOCAL_COMPONENT_SOURCE%\project (\n')
+    _lines.append('  RD /S /Q %LOCAL_COMPONENT_SOURCE%\project\n')
+    _lines.append(')\n\n')
+    _lines.append('if exist "%~dp0\\01_Programs\\" (\n')
+    _lines.append('  call %BASE_ENV_HOME%copy_directory.bat %~dp0\\01_Programs\\ %LOCAL_COMPONENT_SOURCE%\project\\\n')
+    _lines.append(')\n')
+    _lines.append(BATCH_LOGGER_PREFIX + ': Finished copying any client-specific programs.\n')
+
+    _lines.append(BATCH_LOGGER_PREFIX + ': Finished setting up full pipeline environment.\n\n')
+    _lines.append('GOTO :eof\n\n\n')
+
+    _lines.append('rem Define component-specific subroutines for scoping purposes\n\n')
+    for component in components_ordered:
+        LOGGER.info('Generating subroutines for %s', component)
+        _lines.append('\n'.join(component.generate_subroutines()) + '\n\n\n')
+
+    # Publish atomically so an interrupted run never leaves a truncated .bat behind
+    # (named per process so concurrent runs never share a staging file; not tempfile, which would force 0600)
+    path_staging = Path('{}.{}.tmp'.format(name_output, os.getpid()))
+    try:
+        path_staging.write_text(''.join(_lines))
+        os.replace(path_staging, name_output)
+    except BaseException:
+        path_staging.unlink(missing_ok=True)
+        raise
 
     LOGGER.info('Finished generating %s', name_output)
     return 0
@@ -5,10 +5,11 @@
   Test the easily testible bits.
 
 ### DEVELOPER NOTES:
-  Mutates the schema below for testing sanity.
+  Mutates the schema below for testing sanity (and recompiles the validator to match).
 """
 import logging
 import json
+import datetime
 from pathlib import Path
 
 import pytest
@@ -25,6 +26,7 @@ component_finder.SCHEMA_RELEASE['definitions']['authorized_qrm_signers']['enum']
     'moose@milliman.com',
     'squirrel@milliman.com',
 ]
+component_finder.recompile_release_schema()
 
 # =============================================================================
 # LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
@@ -43,7 +45,61 @@ def test_schema_failure():
             with pytest.raises(jsonschema.ValidationError):
                 component_finder.validate_release_schema(json.load(fh_test))
 
+def test_schema_failure_unserializable():
+    """Test that payloads the validation memo cannot key still fail validation cleanly"""
+    with (PATH_TEST_CASES / 'good_releases' / 'with_qvw.json').open() as fh_test:
+        release_json = json.load(fh_test)
+    release_json['explicit_python_subfolder'] = 2 ** 70
+    with pytest.raises(jsonschema.ValidationError):
+        component_finder.validate_release_schema(release_json)
+
+def test_schema_failure_non_json_types():
+    """Test that values the memo key would stringify are still rejected, even after their string twin passed"""
+    with (PATH_TEST_CASES / 'good_releases' / 'with_qvw.json').open() as fh_test:
+        release_json = json.load(fh_test)
+    release_json['qrm']['documentation_home'] = '2020-01-02T03:04:05'
+    component_finder.validate_release_schema(release_json)
+    release_json['qrm']['documentation_home'] = datetime.datetime(2020, 1, 2, 3, 4, 5)
+    with pytest.raises(jsonschema.ValidationError):
+        component_finder.validate_release_schema(release_json)
+
 def test_find_current_release():
     """Test our current Release finder"""
     assert component_finder.find_current_release(PATH_TEST_CASES / 'semver_test') == \
         component_finder.Release(PATH_TEST_CASES / 'semver_test' / 'v2.1.0')
+
+def test_release_json_cache(tmp_path):
+    """Test that edits to a release.json are noticed despite the cache"""
+    with (PATH_TEST_CASES / 'good_releases' / 'with_qvw.json').open() as fh_test:
+        release_json = json.load(fh_test)
+    release_json.pop('path_qvws_git')
+    path_release = tmp_path / 'component' / 'v1.0.0'
+    path_release.mkdir(parents=True)
+    (path_release / 'release.json').write_text(json.dumps(release_json))
+    assert str(component_finder.Release(path_release).url_git_repo) == release_json['url_git_repo']
+
+    release_json['url_git_repo'] += '_renamed'
+    (path_release / 'release.json').write_text(json.dumps(release_json, indent=4))
+    assert str(component_finder.Release(path_release).url_git_repo) == release_json['url_git_repo']
+
+def test_release_try_build():
+    """Test that non-releases are rejected without raising"""
+    assert component_finder.Release.try_build(PATH_TEST_CASES / 'semver_test' / 'v2.1.0')
+    assert component_finder.Release.try_build(PATH_TEST_CASES / 'semver_test' / 'v2.1.1') is None
+    assert component_finder.Release.try_build(PATH_TEST_CASES / 'good_releases') is None
+    with pytest.raises(ValueError):
+        component_finder.Release(PATH_TEST_CASES / 'good_releases')
+
+def test_release_hashable():
+    """Test that equal releases collapse in a set"""
+    path_release = PATH_TEST_CASES / 'semver_test' / 'v2.1.0'
+    assert len({component_finder.Release(path_release), component_finder.Release.try_build(path_release)}) == 1
+
+def test_scan_components(tmp_path):
+    """Test that only actual release folders are kept out of the component scan"""
+    (tmp_path / 'v1.0.0').mkdir()
+    (tmp_path / '2.0.0_archive' / 'v0.1.0').mkdir(parents=True)
+    (tmp_path / 'component' / 'v0.2.0').mkdir(parents=True)
+    found = dict(component_finder.scan_components(tmp_path))
+    assert sorted(found) == ['2.0.0_archive', 'component', tmp_path.name.lower()]
+    assert found['2.0.0_archive'].path == tmp_path / '2.0.0_archive' / 'v0.1.0'
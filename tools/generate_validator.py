@@ -0,0 +1,39 @@
+"""
+### CODE OWNERS: Shea Parkes, Kyle Baird, Ben Copeland
+
+### OBJECTIVE:
+  Pre-compile `release-schema.json` into a plain python validator module.
+
+### DEVELOPER NOTES:
+  Re-run this whenever `python/release-schema.json` changes (e.g. new QRM signers).
+  A stale module is detected via its digest and ignored in favor of compiling at import.
+"""
+import sys
+from pathlib import Path
+
+import fastjsonschema
+
+PATH_PYTHON = Path(__file__).parent.parent / 'python'
+sys.path.insert(0, str(PATH_PYTHON))
+import component_finder # pylint: disable=wrong-import-position
+
+PATH_OUTPUT = PATH_PYTHON / '_release_schema_validator.py'
+
+# =============================================================================
+# LIBRARIES, LOCATIONS, LITERALS, ETC. GO ABOVE HERE
+# =============================================================================
+
+
+def main() -> int:
+    """Write out the generated validator"""
+    code = fastjsonschema.compile_to_code(component_finder.SCHEMA_RELEASE)
+    with PATH_OUTPUT.open('w', newline='\n') as fh_out:
+        fh_out.write('# Generated by tools/generate_validator.py from release-schema.json; do not edit by hand.\n')
+        fh_out.write('# pylint: skip-file\n')
+        fh_out.write("SCHEMA_DIGEST = '{}'\n".format(component_finder.DIGEST_SCHEMA_RELEASE))
+        fh_out.write(code)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())